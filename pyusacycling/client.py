@@ -5,16 +5,90 @@ This module provides the USACyclingClient class, which serves as the main entry
 for interacting with the USA Cycling results data.
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple, Type, TypeVar
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+import asyncio
+import logging
+import threading
+import time
 from datetime import date
 import re
-from bs4 import BeautifulSoup
+import lxml.etree
+import lxml.html
+import requests
 
-from .parser import EventListParser, EventDetailsParser, RaceResultsParser, BaseParser
+from .parser import (
+    EventListParser, EventDetailsParser, RaceResultsParser, extract_date,
+    PERMIT_PAGE_EXPIRE_SECONDS,
+)
 from .models import Event, EventDetails, RaceCategory, RaceResult, Rider
-from .utils import logger, configure_logging
+from .utils import logger, configure_logging, RateLimiter
 from .exceptions import ParseError, NetworkError, ValidationError
-from pydantic import  ValidationError as pydantic_ValidationError
+from pydantic import  BaseModel, ValidationError as pydantic_ValidationError, TypeAdapter
+
+
+# Patterns used while scanning permit pages, compiled once at import time.
+# The info ID and the optional quoted label are captured in a single scan.
+_RE_LOAD_INFO = re.compile(r'loadInfoID\((?P<id>\d+)(?:,\s*[\'"](?P<label>[^\'"]+)[\'"])?')
+_RE_DATE_SUFFIX = re.compile(r'\s+\d{2}/\d{2}/\d{4}$')
+_RE_RACE_ID = re.compile(r'race_(\d+)')
+_RE_NUMBER = re.compile(r'\d+')
+_XPATH_LOAD_INFO_LINKS = lxml.etree.XPath('//a[starts-with(@onclick, "loadInfoID")]')
+
+# Validators for parsed rows, built once rather than per call
+ModelT = TypeVar('ModelT', bound=BaseModel)
+_RIDER_ADAPTER = TypeAdapter(Rider)
+_MODEL_ADAPTERS: Dict[Type[BaseModel], Tuple[TypeAdapter[Any], TypeAdapter[List[Any]]]] = {
+    Event: (TypeAdapter(Event), TypeAdapter(List[Event])),
+    RaceCategory: (TypeAdapter(RaceCategory), TypeAdapter(List[RaceCategory])),
+}
+
+# Default request budget shared by all parsers (and all worker threads) of a client
+RATE_LIMIT_MAX_CALLS = 10
+RATE_LIMIT_PERIOD = 1.0
+
+# Number of (info_id, label) category lists kept in memory per client, and how
+# long they stay fresh (the same expiry as the permit page memo)
+CATEGORY_CACHE_SIZE = 256
+CATEGORY_CACHE_EXPIRE_SECONDS = PERMIT_PAGE_EXPIRE_SECONDS
+
+
+# Level the package logger was last configured with by a client
+_configured_log_level: Optional[str] = None
+
+
+def _configure_logging_once(level: str) -> None:
+    """Configure package logging, unless a client already did so at this level."""
+    global _configured_log_level
+    
+    level = level.upper()
+    if level != _configured_log_level:
+        configure_logging(level=level)
+        _configured_log_level = level
+
+
+def _error_kind(exc: Exception) -> str:
+    """Short label for an error, used to tally skipped rows by cause."""
+    if isinstance(exc, pydantic_ValidationError):
+        return exc.errors()[0]['type']
+    return type(exc).__name__
+
+
+def _future_outcomes(futures: List["Future[Any]"]) -> List[Any]:
+    """
+    Wait for futures in order, returning each result or the exception it raised.
+    
+    This mirrors asyncio.gather(..., return_exceptions=True), so the threaded and
+    asynchronous bulk fetches can share the code that collects their outcomes.
+    """
+    outcomes: List[Any] = []
+    for future in futures:
+        try:
+            outcomes.append(future.result())
+        except Exception as e:
+            outcomes.append(e)
+    return outcomes
 
 
 class USACyclingClient:
@@ -28,6 +102,8 @@ class USACyclingClient:
         cache_enabled: Whether to enable response caching
         cache_dir: Directory to store cached responses
         rate_limit: Whether to enable rate limiting
+        max_workers: Maximum number of concurrent requests in bulk operations
+        trust_parser_output: Whether to skip model validation for parsed rows
     """
     
     def __init__(
@@ -38,6 +114,10 @@ class USACyclingClient:
         max_retries: int = 3,
         retry_delay: float = 2.0,
         log_level: str = "INFO",
+        max_workers: int = 8,
+        trust_parser_output: bool = False,
+        rate_limit_calls: int = RATE_LIMIT_MAX_CALLS,
+        rate_limit_period: float = RATE_LIMIT_PERIOD,
     ):
         """
         Initialize the USA Cycling client.
@@ -49,15 +129,64 @@ class USACyclingClient:
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay between retries in seconds
             log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            max_workers: Maximum number of concurrent requests made by
+                get_complete_event_data and aget_complete_event_data
+            trust_parser_output: Whether to build events, race categories and
+                riders without validating every row. Only the first row is validated, as a check
+                on the shape of the parser output.
+            rate_limit_calls: Maximum number of requests per rate limit period,
+                shared by all requests made through this client
+            rate_limit_period: Length of the rate limit period in seconds
+            
+        Raises:
+            ValidationError: If max_workers or rate_limit_calls is less than 1, or
+                rate_limit_period is not positive
         """
+        if max_workers < 1:
+            raise ValidationError(
+                "max_workers must be at least 1", field="max_workers", value=max_workers
+            )
+        if rate_limit_calls < 1:
+            raise ValidationError(
+                "rate_limit_calls must be at least 1",
+                field="rate_limit_calls", value=rate_limit_calls,
+            )
+        if rate_limit_period <= 0:
+            raise ValidationError(
+                "rate_limit_period must be positive",
+                field="rate_limit_period", value=rate_limit_period,
+            )
+        
         self.cache_enabled = cache_enabled
         self.cache_dir = cache_dir
         self.rate_limit = rate_limit
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.max_workers = max_workers
+        self.trust_parser_output = trust_parser_output
         
-        # Configure logging
-        configure_logging(level=log_level)
+        # Configure logging (only when the requested level changes)
+        _configure_logging_once(log_level)
+        
+        # A single rate limiter is shared by all parsers so that concurrent
+        # requests respect one global budget. Waiting for that budget is routine
+        # in bulk operations, so it is only logged at DEBUG level.
+        self._rate_limiter = RateLimiter(
+            name="usacycling",
+            max_calls=rate_limit_calls,
+            period=rate_limit_period,
+            log_level=logging.DEBUG,
+        )
+        
+        # Race categories already fetched by this client. Maps (info_id, label)
+        # to (expires_at, categories), most recently used last.
+        self._category_cache: (
+            "OrderedDict[Tuple[str, str], Tuple[float, List[RaceCategory]]]"
+        ) = OrderedDict()
+        self._category_cache_lock = threading.Lock()
+        
+        # Parsers share one HTTP session so pooled connections are reused
+        self._session = requests.Session()
         
         # Initialize parsers
         self._event_list_parser = EventListParser(
@@ -66,6 +195,8 @@ class USACyclingClient:
             rate_limit=rate_limit,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            rate_limiter=self._rate_limiter,
+            session=self._session,
         )
         
         self._event_details_parser = EventDetailsParser(
@@ -74,6 +205,8 @@ class USACyclingClient:
             rate_limit=rate_limit,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            rate_limiter=self._rate_limiter,
+            session=self._session,
         )
         
         self._race_results_parser = RaceResultsParser(
@@ -82,6 +215,8 @@ class USACyclingClient:
             rate_limit=rate_limit,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            rate_limiter=self._rate_limiter,
+            session=self._session,
         )
     
     def get_events(self, state: str, year: int) -> List[Event]:
@@ -103,49 +238,94 @@ class USACyclingClient:
         if not state or len(state) != 2:
             raise ValidationError("State must be a two-letter code")
         
+        # Normalize once; these values are shared by every event
+        state = state.upper()
+        common_fields = {'state': state, 'year': year}
+        
         try:
             # Parse event listings
             events_data = self._event_list_parser.get_events(state, year)
             
-            # Convert to Event model objects
-            events = []
-            for event_data in events_data:
-                try:
-                    # Ensure event data has required fields
-                    if not event_data.get('id') or not event_data.get('name'):
-                        logger.warning(
-                            f"Skipping event with incomplete data: {event_data}"
-                        )
-                        continue
-                    
-                    # Convert event_date to date object if it's provided as a string
-                    if 'event_date' in event_data and isinstance(event_data['event_date'], str):
-                        event_data['date'] = self._parse_date(event_data['event_date'])
-                    elif 'event_date' in event_data:
-                        event_data['date'] = event_data['event_date']
-                    
-                    # Create Event object
-                    event = Event(
-                        id=event_data['id'],
-                        name=event_data['name'],
-                        permit_number=event_data.get('permit', ''),
-                        date=event_data.get('date', None),
-                        location=event_data.get('location', 'Unknown'),
-                        state=state,
-                        year=year,
-                        url=event_data.get('permit_url', None),
-                    )
-                    events.append(event)
-                except Exception as e:
-                    logger.warning(f"Error creating Event object: {str(e)}")
-                    continue
+            def event_row(row: Dict[str, Any]) -> Dict[str, Any]:
+                # The parser usually yields dates already; strings are parsed
+                # (and memoized by extract_date)
+                event_date = row.get('event_date')
+                if isinstance(event_date, str):
+                    event_date = self._parse_date(event_date)
+                
+                return {
+                    'id': row['id'],
+                    'name': row['name'],
+                    'permit_number': row.get('permit', ''),
+                    'date': event_date,
+                    'location': row.get('location', 'Unknown'),
+                    'url': row.get('permit_url', None),
+                    **common_fields,
+                }
             
-            return events
+            return self._build_models(Event, events_data, prepare=event_row)
             
         except (NetworkError, ParseError) as e:
             logger.error(f"Error getting events for {state} in {year}: {str(e)}")
             raise
     
+    def _build_models(
+        self,
+        model: Type[ModelT],
+        rows: List[Any],
+        prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        required: Tuple[str, ...] = ('id', 'name'),
+    ) -> List[ModelT]:
+        """
+        Convert parser rows to Event or RaceCategory objects.
+        
+        Rows that are not dictionaries or lack a required field are dropped first,
+        with one warning for the lot. The rest are validated as one batch (or, when
+        the parser output is trusted, only the first row is validated). If that
+        fails, each row is validated on its own so that invalid rows can be skipped.
+        
+        Args:
+            model: Model class to build (Event or RaceCategory)
+            rows: Parser row dictionaries
+            prepare: Optional function mapping a parser row to model field values
+            required: Parser row fields that must be present and non-empty
+            
+        Returns:
+            List of model objects
+        """
+        valid_rows = [
+            row for row in rows
+            if isinstance(row, dict) and all(row.get(field) for field in required)
+        ]
+        if len(valid_rows) < len(rows):
+            logger.warning(
+                "Skipping %d %s rows with incomplete data",
+                len(rows) - len(valid_rows), model.__name__,
+            )
+        field_rows = [prepare(row) for row in valid_rows] if prepare else valid_rows
+        
+        adapter, list_adapter = _MODEL_ADAPTERS[model]
+        try:
+            if self.trust_parser_output and field_rows:
+                objects = [adapter.validate_python(field_rows[0])]
+                objects.extend(model.model_construct(**row) for row in field_rows[1:])
+                return objects
+            
+            return list_adapter.validate_python(field_rows)
+        except pydantic_ValidationError:
+            objects = []
+            errors: Counter[str] = Counter()
+            for row in field_rows:
+                try:
+                    objects.append(model(**row))
+                except Exception as e:
+                    errors[_error_kind(e)] += 1
+            
+            if errors:
+                logger.warning("Error creating %s objects: %s", model.__name__, dict(errors))
+            
+            return objects
+    
     def get_event_details(self, permit: str) -> EventDetails:
         """
         Get detailed information about a specific event.
@@ -188,36 +368,47 @@ class USACyclingClient:
             NetworkError: If there's an issue with the network request
             ParseError: If there's an issue parsing the response
         """
+        cache_key = (info_id, label)
+        if self.cache_enabled:
+            with self._category_cache_lock:
+                cached = self._category_cache.get(cache_key)
+                if cached is not None:
+                    expires_at, cached_categories = cached
+                    if time.time() < expires_at:
+                        self._category_cache.move_to_end(cache_key)
+                        return list(cached_categories)
+                    del self._category_cache[cache_key]
+        
         try:
             # Parse race categories
             categories_data = self._race_results_parser.parse_race_categories(info_id, label)
-            # Convert to RaceCategory model objects
-            categories = []
-            for category_data in categories_data:
-                try:
-                    # Extract event_id from category_data if available
-                    event_id = category_data.get('event_id', '')
-                    if not event_id and 'info_id' in category_data:
-                        # If no event_id is available, use the info_id as a fallback
-                        event_id = category_data['info_id']
-                    
-                    # Create RaceCategory object
-                    category = RaceCategory(
-                        id=category_data['id'],
-                        name=category_data['name'],
-                        event_id=event_id,
-                        discipline=category_data.get('discipline', None),
-                        gender=category_data.get('gender', None),
-                        category_type=category_data.get('category_type', None),
-                        age_range=category_data.get('age_range', None),
-                        category_rank=category_data.get('category_rank', None),
+            
+            # Convert to RaceCategory model objects, using the info_id as the
+            # event_id when no event_id is available
+            def category_row(category_data: Dict[str, Any]) -> Dict[str, Any]:
+                return {
+                    'id': category_data['id'],
+                    'name': category_data['name'],
+                    'event_id': category_data.get('event_id') or category_data.get('info_id', ''),
+                    'discipline': category_data.get('discipline', None),
+                    'gender': category_data.get('gender', None),
+                    'category_type': category_data.get('category_type', None),
+                    'age_range': category_data.get('age_range', None),
+                    'category_rank': category_data.get('category_rank', None),
+                }
+            
+            categories = self._build_models(RaceCategory, categories_data, prepare=category_row)
+            
+            if self.cache_enabled:
+                with self._category_cache_lock:
+                    self._category_cache[cache_key] = (
+                        time.time() + CATEGORY_CACHE_EXPIRE_SECONDS, categories
                     )
-                    categories.append(category)
-                except Exception as e:
-                    logger.warning(f"Error creating RaceCategory object: {str(e)}")
-                    continue
+                    self._category_cache.move_to_end(cache_key)
+                    if len(self._category_cache) > CATEGORY_CACHE_SIZE:
+                        self._category_cache.popitem(last=False)
             
-            return categories
+            return list(categories)
             
         except (NetworkError, ParseError) as e:
             logger.error(f"Error getting race categories for info_id {info_id}: {str(e)}")
@@ -256,26 +447,39 @@ class USACyclingClient:
                 # Use current date as fallback
                 race_data['date'] = date.today()
             
-            # Convert riders to Rider model objects
-            riders = []
-            for rider_data in race_data.get('riders', []):
+            rider_rows = race_data.get('riders') or []
+            if self.trust_parser_output and rider_rows:
                 try:
-                    rider = Rider(**rider_data)
-                    riders.append(rider)
-                except pydantic_ValidationError as exc:
-                    logger.warning(f"ValidationError: {repr(exc.errors()[0]['type'])}")
-                except Exception as e:
-                    logger.warning(f"Error creating Rider object: {str(e)}")
-                    continue
+                    # Check the shape of the first rider, then skip validation
+                    riders = [_RIDER_ADAPTER.validate_python(rider_rows[0])]
+                    riders.extend(
+                        Rider.model_construct(**rider_data) for rider_data in rider_rows[1:]
+                    )
+                except (pydantic_ValidationError, TypeError):
+                    riders = self._validate_riders_individually(race_id, rider_rows)
+            else:
+                # The raw rows are validated in bulk by the RaceResult riders field
+                riders = rider_rows
+            
+            race_fields = {
+                'id': race_data['id'],
+                'event_id': race_data['event_id'],
+                'category': race_data['category'],
+                'date': race_data['date'],
+            }
             
             # Create RaceResult object
-            race_result = RaceResult(
-                id=race_data['id'],
-                event_id=race_data['event_id'],
-                category=race_data['category'],
-                date=race_data['date'],
-                riders=riders,
-            )
+            try:
+                race_result = RaceResult(**race_fields, riders=riders)
+            except pydantic_ValidationError as exc:
+                if not any(error['loc'][:1] == ('riders',) for error in exc.errors()):
+                    raise
+                
+                # Fall back to one rider at a time so invalid rows can be skipped
+                race_result = RaceResult(
+                    **race_fields,
+                    riders=self._validate_riders_individually(race_id, rider_rows),
+                )
             
             return race_result
             
@@ -283,6 +487,35 @@ class USACyclingClient:
             logger.error(f"Error getting race results for race ID {race_id}: {str(e)}")
             raise
     
+    def _validate_riders_individually(
+        self, race_id: str, rider_rows: List[Dict[str, Any]]
+    ) -> List[Rider]:
+        """
+        Validate riders one at a time, skipping invalid rows.
+        
+        Args:
+            race_id: ID of the race, for logging
+            rider_rows: Rider dictionaries from the parser
+            
+        Returns:
+            List of valid Rider objects
+        """
+        riders = []
+        errors: Counter[str] = Counter()
+        for rider_data in rider_rows:
+            try:
+                riders.append(Rider(**rider_data))
+            except Exception as e:
+                errors[_error_kind(e)] += 1
+        
+        if errors:
+            logger.warning(
+                "Skipped %d invalid riders for race %s: %s",
+                sum(errors.values()), race_id, dict(errors),
+            )
+        
+        return riders
+    
     def get_rider_results(
         self, rider_name: str, year: Optional[int] = None
     ) -> List[Tuple[Event, RaceResult]]:
@@ -319,41 +552,72 @@ class USACyclingClient:
                 - label: Discipline label (includes date)
         """
         try:
-            # Fetch the permit page
-            html = self._event_details_parser.fetch_permit_page(permit)
-            
-            # Parse the disciplines from the page
-            soup = BeautifulSoup(html, 'html.parser')
-            
-            # Extract the onclick attribute from discipline links
-            disciplines = []
-            discipline_links = soup.select('a[onclick^="loadInfoID"]')
-            
-            for link in discipline_links:
-                # Extract info_id and label from the onclick attribute
-                onclick = link.get('onclick', '')
-                info_id_match = re.search(r'loadInfoID\((\d+)', onclick)
-                label_match = re.search(r'loadInfoID\(\d+,\s*[\'"]([^\'"]+)[\'"]', onclick)
-                
-                if info_id_match:
-                    info_id = info_id_match.group(1)
-                    label = label_match.group(1) if label_match else ""
-                    name = link.get_text(strip=True)
-                    
-                    # Remove date from name if present
-                    name = re.sub(r'\s+\d{2}/\d{2}/\d{4}$', '', name)
-                    
-                    disciplines.append({
-                        'id': info_id,
-                        'name': name,
-                        'label': label,
-                    })
-            
+            _, disciplines = self._fetch_and_parse_permit(permit)
             return disciplines
             
         except (NetworkError, ParseError) as e:
             logger.error(f"Error getting disciplines for permit {permit}: {str(e)}")
             raise
+    
+    def _fetch_and_parse_permit(
+        self, permit: str
+    ) -> Tuple[lxml.html.HtmlElement, List[Dict[str, Any]]]:
+        """
+        Fetch and parse a permit page, extracting its disciplines.
+        
+        The parsed tree is returned alongside the disciplines so callers that need
+        to look at the permit page again can reuse it instead of re-fetching.
+        
+        Args:
+            permit: USA Cycling permit number (e.g., '2020-26')
+            
+        Returns:
+            Tuple of (parsed permit page, list of discipline dictionaries)
+        """
+        # Fetch the permit page
+        html = self._event_details_parser.fetch_permit_page(permit)
+        
+        # Parse the encoded page so an XML encoding declaration is allowed, and
+        # stand in an empty page for documents lxml finds empty (e.g. only a
+        # comment or doctype)
+        try:
+            tree = lxml.html.fromstring(
+                (html or '').encode('utf-8'),
+                parser=lxml.html.HTMLParser(encoding='utf-8'),
+            )
+        except (ValueError, lxml.etree.ParserError):
+            tree = lxml.html.fromstring('<html></html>')
+        
+        return tree, self._extract_disciplines_lxml(tree)
+    
+    def _extract_disciplines_lxml(
+        self, tree: lxml.html.HtmlElement
+    ) -> List[Dict[str, Any]]:
+        """
+        Extract disciplines from the loadInfoID links of a parsed permit page.
+        
+        Args:
+            tree: Parsed permit page
+            
+        Returns:
+            List of discipline dictionaries
+        """
+        disciplines = []
+        
+        for link in _XPATH_LOAD_INFO_LINKS(tree):
+            # Extract info_id and label from the onclick attribute in one scan
+            load_info_match = _RE_LOAD_INFO.search(link.get('onclick'))
+            if not load_info_match:
+                continue
+            
+            disciplines.append({
+                'id': load_info_match.group('id'),
+                # Remove date from name if present
+                'name': _RE_DATE_SUFFIX.sub('', link.text_content().strip()),
+                'label': load_info_match.group('label') or "",
+            })
+        
+        return disciplines
             
     def get_races_for_permit(self, permit: str) -> List[Dict[str, Any]]:
         """
@@ -373,12 +637,15 @@ class USACyclingClient:
                 - permit: Permit number
         """
         try:
-            # First get all disciplines
-            disciplines = self.get_disciplines_for_event(permit)
+            # First get all disciplines, keeping the parsed page for the fallback below
+            tree, disciplines = self._fetch_and_parse_permit(permit)
             
             # For each discipline, try to extract race IDs
             races = []
             
+            # Race links on the permit page, indexed on first use by the fallback
+            race_links_by_info_id = None
+            
             for discipline in disciplines:
                 info_id = discipline.get('id')
                 label = discipline.get('label')
@@ -392,14 +659,12 @@ class USACyclingClient:
                     
                     # Extract races from categories
                     for category in categories:
-                        # Access attributes directly instead of using .get()
-                        race_id = category.id if hasattr(category, 'id') else None
-                        if race_id:
+                        if category.id:
                             races.append({
-                                'id': race_id,
+                                'id': category.id,
                                 'discipline_id': info_id,
                                 'discipline_name': discipline.get('name'),
-                                'name': category.name if hasattr(category, 'name') else '',
+                                'name': category.name,
                                 'permit': permit
                             })
                 except Exception as e:
@@ -408,24 +673,17 @@ class USACyclingClient:
                     # If categories didn't work, try another approach
                     try:
                         # Directly check for race links in the permit page
-                        html = self._event_details_parser.fetch_permit_page(permit)
-                        soup = BeautifulSoup(html, 'html.parser')
+                        if race_links_by_info_id is None:
+                            race_links_by_info_id = self._index_race_links(tree)
                         
-                        # Look for onclick functions that might contain race IDs
-                        race_links = soup.select(f'a[onclick*="{info_id}"]')
-                        for link in race_links:
-                            onclick = link.get('onclick', '')
-                            race_id_match = re.search(r'race_(\d+)', onclick) 
-                            
-                            if race_id_match:
-                                race_id = race_id_match.group(1)
-                                races.append({
-                                    'id': race_id,
-                                    'discipline_id': info_id,
-                                    'discipline_name': discipline.get('name'),
-                                    'name': link.get_text(strip=True),
-                                    'permit': permit
-                                })
+                        for race_id, name in race_links_by_info_id.get(info_id, []):
+                            races.append({
+                                'id': race_id,
+                                'discipline_id': info_id,
+                                'discipline_name': discipline.get('name'),
+                                'name': name,
+                                'permit': permit
+                            })
                     except Exception as nested_e:
                         logger.warning(
                             f"Error finding race links for discipline {info_id}: {str(nested_e)}"
@@ -464,6 +722,36 @@ class USACyclingClient:
             logger.error(f"Error getting races for permit {permit}: {str(e)}")
             raise
     
+    def _index_race_links(
+        self, tree: lxml.html.HtmlElement
+    ) -> Dict[str, List[Tuple[str, str]]]:
+        """
+        Index the race links of a parsed permit page by the IDs in their onclick.
+        
+        The page is walked once; each link whose onclick references a race is
+        listed under every number that appears in that onclick, so a discipline's
+        race links can be looked up directly by its info ID.
+        
+        Args:
+            tree: Parsed permit page
+            
+        Returns:
+            Dictionary mapping IDs to lists of (race ID, link text) tuples
+        """
+        race_links: Dict[str, List[Tuple[str, str]]] = {}
+        
+        for link in tree.iter('a'):
+            onclick = link.get('onclick') or ''
+            race_id_match = _RE_RACE_ID.search(onclick)
+            if not race_id_match:
+                continue
+            
+            race = (race_id_match.group(1), link.text_content().strip())
+            for number in set(_RE_NUMBER.findall(onclick)):
+                race_links.setdefault(number, []).append(race)
+        
+        return race_links
+    
     def get_complete_event_data(
         self, permit: str, include_results: bool = True
     ) -> Dict[str, Any]:
@@ -487,56 +775,239 @@ class USACyclingClient:
             
             # Get disciplines for the event
             disciplines = self.get_disciplines_for_event(permit)
-            # Get categories for each discipline
-            categories = []
-            for discipline in disciplines:
-                info_id = discipline.get('id')
-                label = discipline.get('label')
+            # Initialize results dictionary
+            results: Dict[str, RaceResult] = {}
+            
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                # Get categories for each discipline concurrently
+                category_disciplines = self._category_disciplines(disciplines)
+                category_lists = _future_outcomes([
+                    executor.submit(self.get_race_categories, discipline['id'], discipline['label'])
+                    for discipline in category_disciplines
+                ])
+                categories = self._collect_categories(category_disciplines, category_lists)
                 
-                if not info_id or not label:
-                    continue
-                    
-                try:
-                    discipline_categories = self.get_race_categories(info_id, label)
-                    categories.extend(discipline_categories)
-                except Exception as e:
-                    logger.warning(f"Error getting categories for discipline {info_id}: {str(e)}")
+                # Fetch results if requested
+                if include_results:
+                    race_requests = self._race_requests(categories, permit)
+                    race_results = _future_outcomes([
+                        executor.submit(self.get_race_results, race_id, category_info=category)
+                        for race_id, category in race_requests
+                    ])
+                    results = self._collect_results(race_requests, race_results)
+            
+            # Combine all data
+            return {
+                'details': details,
+                'disciplines': disciplines,
+                'categories': categories,
+                'results': results
+            }
+            
+        except (NetworkError, ParseError) as e:
+            logger.error(f"Error getting complete event data for permit {permit}: {str(e)}")
+            raise
+    
+    def _category_disciplines(self, disciplines: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Select the disciplines that race categories can be requested for.
+        
+        Args:
+            disciplines: Discipline dictionaries from get_disciplines_for_event
+            
+        Returns:
+            Disciplines that have both an ID and a label
+        """
+        return [
+            discipline for discipline in disciplines
+            if discipline.get('id') and discipline.get('label')
+        ]
+    
+    def _collect_categories(
+        self, disciplines: List[Dict[str, Any]], category_lists: List[Any]
+    ) -> List[RaceCategory]:
+        """
+        Combine per-discipline category lists, logging disciplines that failed.
+        
+        Args:
+            disciplines: Disciplines the categories were requested for
+            category_lists: Category list or raised exception for each discipline
+            
+        Returns:
+            All categories, in discipline order
+        """
+        categories: List[RaceCategory] = []
+        for discipline, discipline_categories in zip(disciplines, category_lists):
+            if isinstance(discipline_categories, BaseException):
+                logger.warning(
+                    f"Error getting categories for discipline {discipline['id']}: "
+                    f"{str(discipline_categories)}"
+                )
+            else:
+                categories.extend(discipline_categories)
+        return categories
+    
+    def _race_requests(
+        self, categories: List[RaceCategory], permit: str
+    ) -> List[Tuple[str, Any]]:
+        """
+        Plan the race result requests for an event.
+        
+        Args:
+            categories: Race categories found for the event
+            permit: USA Cycling permit number, scanned for races when no
+                categories were found
+            
+        Returns:
+            List of (race ID, category info) pairs
+        """
+        # If we found categories, use them to get results
+        if categories:
+            return [(category.id, category) for category in categories if category.id]
+        
+        # If no categories were found through normal means, try using races instead
+        logger.info("No categories found, attempting to get race IDs directly")
+        
+        races = self.get_races_for_permit(permit)
+        return [(race['id'], None) for race in races if race.get('id')]
+    
+    def _collect_results(
+        self, race_requests: List[Tuple[str, Any]], race_results: List[Any]
+    ) -> Dict[str, RaceResult]:
+        """
+        Map race IDs to their results, logging races that failed.
+        
+        Args:
+            race_requests: (race ID, category info) pairs that were requested
+            race_results: RaceResult or raised exception for each request
+            
+        Returns:
+            Dictionary of race ID to RaceResult
+        """
+        results: Dict[str, RaceResult] = {}
+        for (race_id, _), race_result in zip(race_requests, race_results):
+            if isinstance(race_result, BaseException):
+                logger.warning(f"Error getting results for race {race_id}: {str(race_result)}")
+            else:
+                results[race_id] = race_result
+        return results
+    
+    async def aget_events(self, state: str, year: int) -> List[Event]:
+        """
+        Asynchronous version of get_events.
+        
+        The blocking request runs in a worker thread, so other coroutines keep
+        running while it waits on the network.
+        
+        Args:
+            state: Two-letter state code (e.g., 'CA', 'NY')
+            year: Year to search for events (e.g., 2020)
+            
+        Returns:
+            List of Event objects
+        """
+        return await asyncio.to_thread(self.get_events, state, year)
+    
+    async def aget_disciplines_for_event(self, permit: str) -> List[Dict[str, Any]]:
+        """
+        Asynchronous version of get_disciplines_for_event.
+        
+        Args:
+            permit: USA Cycling permit number (e.g., '2020-26')
+            
+        Returns:
+            List of discipline dictionaries
+        """
+        return await asyncio.to_thread(self.get_disciplines_for_event, permit)
+    
+    async def aget_race_categories(self, info_id: str, label: str) -> List[RaceCategory]:
+        """
+        Asynchronous version of get_race_categories.
+        
+        Args:
+            info_id: The info ID for the discipline
+            label: The label for the discipline
+            
+        Returns:
+            List of RaceCategory objects
+        """
+        return await asyncio.to_thread(self.get_race_categories, info_id, label)
+    
+    async def aget_race_results(
+        self, race_id: str, category_info: Optional[Dict[str, Any]] = None
+    ) -> RaceResult:
+        """
+        Asynchronous version of get_race_results.
+        
+        Args:
+            race_id: ID of the race
+            category_info: Optional category information to include
+            
+        Returns:
+            RaceResult object
+        """
+        return await asyncio.to_thread(self.get_race_results, race_id, category_info)
+    
+    async def aget_complete_event_data(
+        self, permit: str, include_results: bool = True
+    ) -> Dict[str, Any]:
+        """
+        Asynchronous version of get_complete_event_data.
+        
+        Disciplines are fetched first, then event details (which reuse the
+        permit page the disciplines were read from), then all categories and
+        all results with at most max_workers requests in flight. Requests
+        still go through the client's shared rate limiter.
+        
+        Args:
+            permit: USA Cycling permit number (e.g., '2020-26')
+            include_results: Whether to include race results
+            
+        Returns:
+            Dictionary containing event data (details, disciplines, categories, results)
+            
+        Raises:
+            NetworkError: If there's an issue with the network request
+            ParseError: If there's an issue parsing the response
+        """
+        semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async def run(call: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+            async with semaphore:
+                return await asyncio.to_thread(call, *args, **kwargs)
+        
+        try:
+            # Both read the permit page, so fetch them in turn rather than
+            # together, letting the second hit the parser's memoized copy
+            disciplines = await run(self.get_disciplines_for_event, permit)
+            details = await run(self.get_event_details, permit)
+            
+            # Get categories for each discipline concurrently
+            category_disciplines = self._category_disciplines(disciplines)
+            category_lists = await asyncio.gather(
+                *(
+                    run(self.get_race_categories, discipline['id'], discipline['label'])
+                    for discipline in category_disciplines
+                ),
+                return_exceptions=True,
+            )
+            categories = self._collect_categories(category_disciplines, category_lists)
             
             # Initialize results dictionary
-            results = {}
+            results: Dict[str, RaceResult] = {}
             
             # Fetch results if requested
             if include_results:
-                # Debug print to see what categories contain
-                # If we found categories, use them to get results
-                if categories:
-                    for category in categories:
-                        # Access attributes directly instead of using .get()
-                        race_id = category.id if hasattr(category, 'id') else None
-                        if not race_id:
-                            continue
-                            
-                        try:
-                            race_results = self.get_race_results(race_id, category_info=category)
-                            results[race_id] = race_results
-                        except Exception as e:
-                            logger.warning(f"Error getting results for race {race_id}: {str(e)}")
-                else:
-                    # If no categories were found through normal means, try using races instead
-                    logger.info("No categories found, attempting to get race IDs directly")
-                    
-                    races = self.get_races_for_permit(permit)
-                    if races:
-                        for race in races:
-                            race_id = race.get('id')
-                            if not race_id:
-                                continue
-                                
-                            try:
-                                race_results = self.get_race_results(race_id)
-                                results[race_id] = race_results
-                            except Exception as e:
-                                logger.warning(f"Error getting results for race {race_id}: {str(e)}")
+                # May fall back to scanning the permit page, so run it off the loop
+                race_requests = await run(self._race_requests, categories, permit)
+                race_results = await asyncio.gather(
+                    *(
+                        run(self.get_race_results, race_id, category_info=category)
+                        for race_id, category in race_requests
+                    ),
+                    return_exceptions=True,
+                )
+                results = self._collect_results(race_requests, race_results)
             
             # Combine all data
             return {
@@ -552,7 +1023,7 @@ class USACyclingClient:
     
     def _parse_date(self, date_str: str) -> date:
         """
-        Parse a date string using the BaseParser's _extract_date method.
+        Parse a date string using the parser module's extract_date function.
         
         Args:
             date_str: Date string to parse
@@ -560,11 +1031,5 @@ class USACyclingClient:
         Returns:
             date object or today's date if parsing fails
         """
-        # Create a temporary BaseParser instance
-        parser = BaseParser(cache_enabled=False)
-        
-        # Parse the date
-        parsed_date = parser._extract_date(date_str)
-        
         # Return the parsed date or today's date if parsing fails
-        return parsed_date or date.today() 
\ No newline at end of file
+        return extract_date(date_str) or date.today()
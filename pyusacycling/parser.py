@@ -1,19 +1,91 @@
 """
 Parser classes for the USA Cycling Results Parser package.
 """
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict
+import functools
 import os
 import json
+import threading
 import time
 from datetime import date, datetime
 from pathlib import Path
 from urllib.parse import urljoin, quote
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 import re
 from .exceptions import ParseError, NetworkError
-from .utils import logger
+from .utils import logger, RateLimiter
+
+try:
+    import orjson  # type: ignore[import-not-found]
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
+
+DATE_FORMATS = [
+    "%m/%d/%Y",  # 12/31/2020
+    "%Y-%m-%d",  # 2020-12-31
+    "%B %d, %Y", # December 31, 2020
+    "%b %d, %Y", # Dec 31, 2020
+]
+
+
+# Restrict parsing to the only elements some pages are read for
+RACE_ITEMS_STRAINER = SoupStrainer('li', id=re.compile(r'^race_'))
+EVENT_TABLE_STRAINER = SoupStrainer(
+    'table', class_=lambda classes: bool(classes) and 'datatable' in classes.split()
+)
+
+# Permit pages kept in memory per parser, and how long they stay fresh
+# (the same expiry _save_to_cache applies on disk)
+PERMIT_PAGE_CACHE_SIZE = 64
+PERMIT_PAGE_EXPIRE_SECONDS = 3600
+
+
+def json_loads(data: Any) -> Any:
+    """
+    Decode a JSON document, using orjson when it is installed.
+    
+    Both decoders raise json.JSONDecodeError (orjson's error subclasses it),
+    so callers handle failures the same way either way.
+    
+    Args:
+        data: JSON document as str or bytes
+        
+    Returns:
+        Decoded JSON value
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@functools.lru_cache(maxsize=512)
+def extract_date(date_str: str) -> Optional[date]:
+    """
+    Extract date from a string.
+    
+    Results are memoized, since the same event dates recur across a listing.
+    
+    Args:
+        date_str: Date string in various formats
+        
+    Returns:
+        date object or None if parsing fails
+    """
+    if not date_str:
+        return None
+        
+    for date_format in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str.strip(), date_format).date()
+        except ValueError:
+            continue
+            
+    logger.warning(f"Failed to parse date: {date_str}")
+    return None
 
 
 class BaseParser:
@@ -47,6 +119,8 @@ class BaseParser:
         rate_limit: bool = True,
         max_retries: int = 3,
         retry_delay: float = 2.0,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
     ):
         """
         Initialize the base parser.
@@ -57,19 +131,30 @@ class BaseParser:
             rate_limit: Whether to enable rate limiting
             max_retries: Maximum number of retries for failed requests
             retry_delay: Delay between retries in seconds
+            rate_limiter: Optional rate limiter shared with other parsers, acquired
+                before every request when rate limiting is enabled
+            session: Optional HTTP session shared with other parsers so that
+                pooled connections are reused across them
         """
         self.cache_enabled = cache_enabled
         self.cache_dir = cache_dir or os.path.expanduser("~/.pyusacycling/cache")
         self.rate_limit = rate_limit
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.rate_limiter = rate_limiter
         
         # Create cache directory if it doesn't exist
         if self.cache_enabled:
             os.makedirs(self.cache_dir, exist_ok=True)
         
-        self.session = requests.Session()
+        self.session = session or requests.Session()
         self.session.headers.update(self.DEFAULT_HEADERS)
+        
+        # In-memory copies of permit pages, which several client methods
+        # request for the same permit. Maps permit to (expires_at, html),
+        # most recently used last.
+        self._permit_pages: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._permit_pages_lock = threading.Lock()
     
     def _get_cache_path(self, url: str) -> Path:
         """
@@ -104,8 +189,8 @@ class BaseParser:
             return None
             
         try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
+            with open(cache_path, "rb") as f:
+                cache_data = json_loads(f.read())
                 
             # Check if cache is expired
             if "expires_at" in cache_data:
@@ -188,6 +273,9 @@ class BaseParser:
             
         for attempt in range(self.max_retries):
             try:
+                if self.rate_limit and self.rate_limiter is not None:
+                    self.rate_limiter.acquire()
+                
                 response = self.session.request(
                     method=method,
                     url=url,
@@ -327,12 +415,15 @@ class BaseParser:
             else:
                 raise NetworkError(f"Failed to fetch JSON from {url}: {str(e)}")
     
-    def _make_soup(self, html: str) -> BeautifulSoup:
+    def _make_soup(
+        self, html: str, parse_only: Optional[SoupStrainer] = None
+    ) -> BeautifulSoup:
         """
         Create a BeautifulSoup object from HTML.
         
         Args:
             html: HTML content
+            parse_only: Optional strainer limiting the tree to matching elements
             
         Returns:
             BeautifulSoup: Parsed HTML
@@ -341,7 +432,7 @@ class BaseParser:
             ParseError: If parsing fails
         """
         try:
-            return BeautifulSoup(html, 'html.parser')
+            return BeautifulSoup(html, 'html.parser', parse_only=parse_only)
         except Exception as e:
             logger.error(f"Failed to parse HTML: {str(e)}")
             raise ParseError(f"Failed to parse HTML: {str(e)}")
@@ -375,24 +466,7 @@ class BaseParser:
         Returns:
             date object or None if parsing fails
         """
-        if not date_str:
-            return None
-            
-        date_formats = [
-            "%m/%d/%Y",  # 12/31/2020
-            "%Y-%m-%d",  # 2020-12-31
-            "%B %d, %Y", # December 31, 2020
-            "%b %d, %Y", # Dec 31, 2020
-        ]
-        
-        for date_format in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), date_format).date()
-            except ValueError:
-                continue
-                
-        logger.warning(f"Failed to parse date: {date_str}")
-        return None
+        return extract_date(date_str)
     
     def _extract_load_info_id(self, onclick_text: str) -> Optional[str]:
         """
@@ -507,8 +581,27 @@ class BaseParser:
         Returns:
             HTML content of permit page
         """
+        if self.cache_enabled:
+            with self._permit_pages_lock:
+                cached = self._permit_pages.get(permit)
+                if cached is not None:
+                    expires_at, html = cached
+                    if time.time() < expires_at:
+                        self._permit_pages.move_to_end(permit)
+                        return html
+                    del self._permit_pages[permit]
+        
         url = self._build_permit_url(permit)
-        return self._fetch_content(url)
+        html = self._fetch_content(url)
+        
+        if self.cache_enabled:
+            with self._permit_pages_lock:
+                self._permit_pages[permit] = (time.time() + PERMIT_PAGE_EXPIRE_SECONDS, html)
+                self._permit_pages.move_to_end(permit)
+                if len(self._permit_pages) > PERMIT_PAGE_CACHE_SIZE:
+                    self._permit_pages.popitem(last=False)
+        
+        return html
     
     def fetch_load_info(self, info_id: str, label: str) -> Dict[str, Any]:
         """
@@ -523,7 +616,7 @@ class BaseParser:
         """
         url = self._build_load_info_url(info_id, label)
         html_content = self._fetch_content(url)
-        soup = self._make_soup(html_content)
+        soup = self._make_soup(html_content, parse_only=RACE_ITEMS_STRAINER)
         
         # Extract race categories from HTML
         result = {"categories": []}
@@ -581,7 +674,7 @@ class BaseParser:
             json_data = None
             if html_content.startswith('{'):
                 try:
-                    json_data = json.loads(html_content)
+                    json_data = json_loads(html_content)
                     if 'message' in json_data:
                         # Extract HTML from JSON response
                         html_content = json_data['message']
@@ -720,8 +813,8 @@ class EventListParser(BaseParser):
         # Fetch the event list HTML
         html = self.fetch_event_list(state, year)
         
-        # Parse HTML with BeautifulSoup
-        soup = self._make_soup(html)
+        # Parse HTML with BeautifulSoup, keeping only the event table
+        soup = self._make_soup(html, parse_only=EVENT_TABLE_STRAINER)
         
         # Find the event table
         events_table = soup.find('table', class_='datatable')
@@ -413,7 +413,7 @@ class RateLimiter:
     
     def __init__(self, name: str = None, max_calls: int = 60, period: float = 60,
                  backoff_factor: float = 2.0, max_backoff: float = 60.0, 
-                 jitter: bool = True):
+                 jitter: bool = True, log_level: int = logging.WARNING):
         """
         Initialize a rate limiter.
         
@@ -424,6 +424,7 @@ class RateLimiter:
             backoff_factor: Multiplier for the exponential backoff
             max_backoff: Maximum backoff time in seconds
             jitter: Whether to add randomness to the backoff time
+            log_level: Level at which throttling messages are logged
         """
         import threading
         from collections import deque
@@ -434,6 +435,7 @@ class RateLimiter:
         self.backoff_factor = backoff_factor
         self.max_backoff = max_backoff
         self.jitter = jitter
+        self.log_level = log_level
         
         self.logger = get_logger(f"rate_limiter.{self.name}")
         self.lock = threading.RLock()
@@ -471,7 +473,8 @@ class RateLimiter:
                 # Check if we're in backoff mode
                 if self.backoff_until and now < self.backoff_until:
                     wait_time = (self.backoff_until - now).total_seconds()
-                    self.logger.warning(
+                    self.logger.log(
+                        self.log_level,
                         f"Rate limit exceeded, backing off for {wait_time:.2f} seconds"
                     )
                     time.sleep(wait_time)
@@ -496,7 +499,8 @@ class RateLimiter:
                     
                     self.backoff_until = now + timedelta(seconds=backoff_time)
                     
-                    self.logger.warning(
+                    self.logger.log(
+                        self.log_level,
                         f"Rate limit of {self.max_calls} calls per {self.period}s exceeded. "
                         f"Backing off for {backoff_time:.2f}s"
                     )
@@ -35,11 +35,14 @@ setup(
     install_requires=[
         "requests>=2.25.0",
         "beautifulsoup4>=4.9.0",
-        "pydantic>=1.9.0",
+        "pydantic>=2.0.0",
         "lxml>=4.6.0",  # For better HTML parsing performance
         "python-dateutil>=2.8.2",  # For date parsing
     ],
     extras_require={
+        "fast": [
+            "orjson>=3.6.0",  # Faster JSON decoding of responses and cache files
+        ],
         "dev": [
             "pytest>=6.0.0",
             "pytest-cov>=2.12.0",
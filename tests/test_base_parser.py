@@ -1,6 +1,7 @@
 """
 Tests for the BaseParser class.
 """
+import json
 import tempfile
 import unittest
 from unittest import mock
@@ -8,7 +9,10 @@ from unittest import mock
 import requests
 from bs4 import BeautifulSoup
 
-from pyusacycling.parser import BaseParser
+from pyusacycling.parser import (
+    BaseParser, EVENT_TABLE_STRAINER, PERMIT_PAGE_EXPIRE_SECONDS, RACE_ITEMS_STRAINER,
+    json_loads, orjson,
+)
 from pyusacycling.exceptions import NetworkError, ParseError
 
 
@@ -138,6 +142,38 @@ class TestBaseParser(unittest.TestCase):
         with self.assertRaises(ParseError):
             self.parser._fetch_json(self.load_info_url)
     
+    def test_json_loads(self):
+        """Test decoding JSON with the standard library when orjson is missing."""
+        document = '{"message": "<div>Results</div>", "riders": [1, 2]}'
+        expected = {"message": "<div>Results</div>", "riders": [1, 2]}
+        
+        with mock.patch('pyusacycling.parser.orjson', None):
+            self.assertEqual(json_loads(document), expected)
+            self.assertEqual(json_loads(document.encode("utf-8")), expected)
+            with self.assertRaises(json.JSONDecodeError):
+                json_loads("{not json")
+    
+    def test_json_loads_orjson(self):
+        """Test that decoding is delegated to orjson when it is installed."""
+        fake_orjson = mock.Mock()
+        fake_orjson.loads.return_value = {"riders": []}
+        
+        with mock.patch('pyusacycling.parser.orjson', fake_orjson):
+            self.assertEqual(json_loads(b'{"riders": []}'), {"riders": []})
+        
+        fake_orjson.loads.assert_called_once_with(b'{"riders": []}')
+    
+    @unittest.skipUnless(orjson, "orjson is not installed")
+    def test_json_loads_orjson_installed(self):
+        """Test decoding with the real orjson, including its error type."""
+        document = '{"message": "<div>Results</div>", "riders": [1, 2]}'
+        expected = {"message": "<div>Results</div>", "riders": [1, 2]}
+        
+        self.assertEqual(json_loads(document), expected)
+        self.assertEqual(json_loads(document.encode("utf-8")), expected)
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads("{not json")
+    
     def test_make_soup(self):
         """Test creating a BeautifulSoup object."""
         html = "<html><body>Test</body></html>"
@@ -149,6 +185,35 @@ class TestBaseParser(unittest.TestCase):
         self.assertIsNotNone(body)
         self.assertEqual(body.get_text(), "Test")
     
+    def test_make_soup_parse_only(self):
+        """Test restricting a BeautifulSoup tree with a strainer."""
+        html = (
+            "<html><body><h3>Event</h3><ul>"
+            "<li id='race_1337864'><a>Men A</a></li>"
+            "<li id='other'>Skip</li>"
+            "</ul></body></html>"
+        )
+        soup = self.parser._make_soup(html, parse_only=RACE_ITEMS_STRAINER)
+        
+        self.assertIsNone(soup.find('h3'))
+        items = soup.find_all('li')
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0].a.get_text(), "Men A")
+        
+        # Tables are matched on the datatable class among any others
+        html = (
+            "<html><body><h3>Events</h3>"
+            "<table class='datatable stripe'><tr><td>Event</td></tr></table>"
+            "<table class='layout'><tr><td>Skip</td></tr></table>"
+            "</body></html>"
+        )
+        soup = self.parser._make_soup(html, parse_only=EVENT_TABLE_STRAINER)
+        
+        self.assertIsNone(soup.find('h3'))
+        tables = soup.find_all('table')
+        self.assertEqual(len(tables), 1)
+        self.assertEqual(tables[0].td.get_text(), "Event")
+    
     def test_extract_text(self):
         """Test extracting text from BeautifulSoup elements."""
         html = "<div>   Test text with spaces   </div>"
@@ -250,6 +315,44 @@ class TestBaseParser(unittest.TestCase):
         self.assertEqual(content, "<html>Permit page</html>")
         mock_fetch.assert_called_once()
     
+    @mock.patch('pyusacycling.parser.BaseParser._fetch_content')
+    def test_fetch_permit_page_memoized(self, mock_fetch):
+        """Test that repeated permit page fetches are served from memory."""
+        mock_fetch.return_value = "<html>Permit page</html>"
+        
+        first = self.parser.fetch_permit_page("2020-26")
+        second = self.parser.fetch_permit_page("2020-26")
+        
+        self.assertEqual(first, second)
+        mock_fetch.assert_called_once()
+        
+        # Without caching every call goes to the network
+        parser = BaseParser(cache_enabled=False)
+        parser.fetch_permit_page("2020-26")
+        parser.fetch_permit_page("2020-26")
+        self.assertEqual(mock_fetch.call_count, 3)
+    
+    @mock.patch('pyusacycling.parser.PERMIT_PAGE_CACHE_SIZE', 2)
+    @mock.patch('pyusacycling.parser.time.time')
+    @mock.patch('pyusacycling.parser.BaseParser._fetch_content')
+    def test_fetch_permit_page_memo_bounded(self, mock_fetch, mock_time):
+        """Test that memoized permit pages are evicted and expire."""
+        mock_fetch.return_value = "<html>Permit page</html>"
+        mock_time.return_value = 1000.0
+        
+        # The least recently used permit is evicted once the memo is full
+        for permit in ("2020-1", "2020-2", "2020-3"):
+            self.parser.fetch_permit_page(permit)
+        self.assertEqual(list(self.parser._permit_pages), ["2020-2", "2020-3"])
+        
+        self.parser.fetch_permit_page("2020-3")
+        self.assertEqual(mock_fetch.call_count, 3)
+        
+        # Pages are fetched again once they are older than the cache expiry
+        mock_time.return_value = 1000.0 + PERMIT_PAGE_EXPIRE_SECONDS
+        self.parser.fetch_permit_page("2020-3")
+        self.assertEqual(mock_fetch.call_count, 4)
+    
     @mock.patch('pyusacycling.parser.BaseParser._fetch_json')
     def test_fetch_load_info(self, mock_fetch):
         """Test fetching load info data."""
@@ -1,13 +1,16 @@
 """
 Tests for the USACyclingClient class.
 """
+import asyncio
+import logging
 import os
+import tempfile
 import unittest
 from unittest import mock
 from datetime import date
 from pathlib import Path
 
-from pyusacycling.client import USACyclingClient
+from pyusacycling.client import CATEGORY_CACHE_EXPIRE_SECONDS, USACyclingClient
 from pyusacycling.models import Event, EventDetails, RaceCategory, RaceResult
 from pyusacycling.exceptions import NetworkError, ParseError, ValidationError
 
@@ -22,6 +25,33 @@ class TestUSACyclingClient(unittest.TestCase):
         # Path to test fixtures
         self.samples_dir = Path(os.path.dirname(os.path.dirname(__file__))) / "samples"
     
+    @mock.patch('pyusacycling.client._configured_log_level', None)
+    @mock.patch('pyusacycling.client.configure_logging')
+    def test_logging_configured_once(self, mock_configure_logging):
+        """Test that constructing more clients does not reconfigure logging."""
+        USACyclingClient(cache_enabled=False, log_level="INFO")
+        USACyclingClient(cache_enabled=False, log_level="info")
+        mock_configure_logging.assert_called_once_with(level="INFO")
+        
+        USACyclingClient(cache_enabled=False, log_level="DEBUG")
+        self.assertEqual(mock_configure_logging.call_count, 2)
+    
+    def test_parsers_share_rate_limiter(self):
+        """Test that all parsers draw from the client's single rate limiter."""
+        limiter = self.client._rate_limiter
+        self.assertIs(self.client._event_list_parser.rate_limiter, limiter)
+        self.assertIs(self.client._event_details_parser.rate_limiter, limiter)
+        self.assertIs(self.client._race_results_parser.rate_limiter, limiter)
+    
+    def test_rate_limit_budget(self):
+        """Test that the shared rate limit budget is configurable."""
+        client = USACyclingClient(cache_enabled=False, rate_limit_calls=2, rate_limit_period=5.0)
+        self.assertEqual(client._rate_limiter.max_calls, 2)
+        self.assertEqual(client._rate_limiter.period, 5.0)
+        
+        # Throttling is routine for the shared limiter, so it is not a warning
+        self.assertEqual(client._rate_limiter.log_level, logging.DEBUG)
+    
     @mock.patch('pyusacycling.parser.EventListParser.get_events')
     def test_get_events(self, mock_get_events):
         """Test getting events."""
@@ -51,6 +81,42 @@ class TestUSACyclingClient(unittest.TestCase):
         self.assertEqual(events[0].state, 'CO')
         self.assertEqual(events[0].year, 2020)
     
+    @mock.patch('pyusacycling.parser.EventListParser.get_events')
+    def test_get_events_skips_invalid_rows(self, mock_get_events):
+        """Test that incomplete or invalid event rows are skipped."""
+        mock_get_events.return_value = [
+            {'id': '2020-26', 'name': 'December VRL', 'permit': '2020-26',
+             'event_date': '12/02/2020', 'location': 'Colorado Springs'},
+            {'id': '2020-27', 'name': ''},
+            {'id': '2020-28', 'name': 'No Date Race', 'permit': '2020-28'},
+            {'id': '2020-29', 'name': 'January VRL', 'permit': '2020-29',
+             'event_date': '12/02/2020', 'location': 'Denver'},
+            None,
+            {'id': '2020-30', 'name': 'Unhashable Date', 'event_date': ['12/02/2020']},
+            {'id': '2020-31', 'name': 'February VRL', 'event_date': date(2021, 2, 3)},
+        ]
+        
+        with self.assertLogs('pyusacycling', level='WARNING') as logs:
+            events = self.client.get_events('CO', 2020)
+        
+        self.assertEqual([event.id for event in events], ['2020-26', '2020-29', '2020-31'])
+        self.assertIn("Skipping 2 Event rows", logs.output[0])
+        self.assertEqual(events[0].date, date(2020, 12, 2))
+        self.assertEqual(events[1].date, date(2020, 12, 2))
+        self.assertEqual(events[2].date, date(2021, 2, 3))
+    
+    @mock.patch('pyusacycling.parser.EventListParser.get_events')
+    def test_get_events_normalizes_state(self, mock_get_events):
+        """Test that the state code is upper-cased before use."""
+        mock_get_events.return_value = [
+            {'id': '2020-26', 'name': 'December VRL', 'event_date': '12/02/2020'},
+        ]
+        
+        events = self.client.get_events('co', 2020)
+        
+        mock_get_events.assert_called_once_with('CO', 2020)
+        self.assertEqual(events[0].state, 'CO')
+    
     def test_get_events_invalid_state(self):
         """Test getting events with an invalid state."""
         with self.assertRaises(ValidationError):
@@ -119,6 +185,69 @@ class TestUSACyclingClient(unittest.TestCase):
         self.assertEqual(categories[0].gender, 'Men')
         self.assertEqual(categories[0].category_rank, 'A')
     
+    @mock.patch('pyusacycling.parser.RaceResultsParser.parse_race_categories')
+    def test_get_race_categories_skips_invalid_rows(self, mock_parse_race_categories):
+        """Test that invalid category rows are skipped and event_id falls back to info_id."""
+        mock_parse_race_categories.return_value = [
+            {'id': '1337864', 'name': 'Men A', 'info_id': '132893'},
+            {'name': 'No ID', 'info_id': '132893'},
+            {'id': '1337865', 'name': 'Men B', 'event_id': '2020-26'},
+        ]
+        
+        with self.assertLogs('pyusacycling', level='WARNING') as logs:
+            categories = self.client.get_race_categories('132893', 'Road 12/02/2020')
+        
+        self.assertEqual([category.id for category in categories], ['1337864', '1337865'])
+        self.assertEqual(categories[0].event_id, '132893')
+        self.assertEqual(categories[1].event_id, '2020-26')
+        self.assertIn("Skipping 1 RaceCategory rows", logs.output[0])
+        
+        # Incomplete rows are dropped before trusted rows skip validation too
+        client = USACyclingClient(cache_enabled=False, trust_parser_output=True)
+        categories = client.get_race_categories('132893', 'Road 12/02/2020')
+        self.assertEqual([category.id for category in categories], ['1337864', '1337865'])
+    
+    @mock.patch('pyusacycling.parser.RaceResultsParser.parse_race_categories')
+    def test_get_race_categories_cached(self, mock_parse_race_categories):
+        """Test that repeated category lookups are served from memory."""
+        mock_parse_race_categories.return_value = [
+            {'id': '1337864', 'name': 'XCU Men 1:55 Category A', 'info_id': '132893'}
+        ]
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = USACyclingClient(cache_enabled=True, cache_dir=cache_dir)
+            first = client.get_race_categories('132893', 'Road 12/02/2020')
+            second = client.get_race_categories('132893', 'Road 12/02/2020')
+        
+        self.assertEqual(first, second)
+        mock_parse_race_categories.assert_called_once_with('132893', 'Road 12/02/2020')
+        
+        # Caching disabled always goes back to the parser
+        self.client.get_race_categories('132893', 'Road 12/02/2020')
+        self.client.get_race_categories('132893', 'Road 12/02/2020')
+        self.assertEqual(mock_parse_race_categories.call_count, 3)
+    
+    @mock.patch('pyusacycling.client.time.time')
+    @mock.patch('pyusacycling.parser.RaceResultsParser.parse_race_categories')
+    def test_get_race_categories_cache_expires(self, mock_parse_race_categories, mock_time):
+        """Test that cached category lists are fetched again once they expire."""
+        mock_parse_race_categories.return_value = [
+            {'id': '1337864', 'name': 'XCU Men 1:55 Category A', 'info_id': '132893'}
+        ]
+        mock_time.return_value = 1000.0
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = USACyclingClient(cache_enabled=True, cache_dir=cache_dir)
+            client.get_race_categories('132893', 'Road 12/02/2020')
+            
+            mock_time.return_value = 1000.0 + CATEGORY_CACHE_EXPIRE_SECONDS - 1
+            client.get_race_categories('132893', 'Road 12/02/2020')
+            self.assertEqual(mock_parse_race_categories.call_count, 1)
+            
+            mock_time.return_value = 1000.0 + CATEGORY_CACHE_EXPIRE_SECONDS
+            client.get_race_categories('132893', 'Road 12/02/2020')
+            self.assertEqual(mock_parse_race_categories.call_count, 2)
+    
     @mock.patch('pyusacycling.parser.RaceResultsParser.get_race_results')
     def test_get_race_results(self, mock_get_race_results):
         """Test getting race results."""
@@ -161,37 +290,83 @@ class TestUSACyclingClient(unittest.TestCase):
         self.assertEqual(race_results.riders[0].name, 'John Doe')
         self.assertEqual(race_results.riders[0].place, '1')
     
-    @mock.patch('pyusacycling.parser.EventDetailsParser.fetch_permit_page')
-    @mock.patch('pyusacycling.parser.BaseParser._extract_load_info_id')
-    @mock.patch('pyusacycling.parser.BaseParser._make_soup')
-    @mock.patch('pyusacycling.parser.BaseParser._extract_text')
-    def test_get_disciplines_for_event(self, mock_extract_text, mock_make_soup, 
-                                      mock_extract_load_info_id, mock_fetch_permit_page):
-        """Test getting disciplines for an event."""
-        # Mock fetch_permit_page
-        mock_fetch_permit_page.return_value = "<html><body></body></html>"
+    @mock.patch('pyusacycling.parser.RaceResultsParser.get_race_results')
+    def test_get_race_results_skips_invalid_riders(self, mock_get_race_results):
+        """Test that one invalid rider does not discard the rest of the results."""
+        mock_get_race_results.return_value = {
+            'id': '1337864',
+            'category': 'XCU Men 1:55 Category A',
+            'riders': [
+                {'place': '1', 'name': 'John Doe'},
+                {'place': '2'},
+                {'place': '3', 'name': 'Jane Roe'},
+                {'place': '4'},
+            ],
+            'event_id': '2020-26',
+            'date': date(2020, 12, 2)
+        }
+        
+        with self.assertLogs('pyusacycling', level='WARNING') as logs:
+            race_results = self.client.get_race_results('1337864')
         
-        # Mock _make_soup
-        mock_soup = mock.MagicMock()
-        mock_make_soup.return_value = mock_soup
+        self.assertEqual([rider.name for rider in race_results.riders], ['John Doe', 'Jane Roe'])
+        # Skipped riders are reported in a single summary line
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn("Skipped 2 invalid riders", logs.output[0])
+    
+    @mock.patch('pyusacycling.parser.RaceResultsParser.get_race_results')
+    def test_get_race_results_trusted_parser_output(self, mock_get_race_results):
+        """Test building riders without per-row validation."""
+        mock_get_race_results.return_value = {
+            'id': '1337864',
+            'category': 'XCU Men 1:55 Category A',
+            'riders': [
+                {'place': '1', 'name': 'John Doe', 'is_dnf': False},
+                {'place': '2', 'name': 'Jane Roe', 'is_dnf': False},
+            ],
+            'event_id': '2020-26',
+            'date': date(2020, 12, 2)
+        }
+        client = USACyclingClient(cache_enabled=False, trust_parser_output=True)
         
-        # Mock select
-        link1 = mock.MagicMock()
-        link1.get.return_value = "loadInfoID(132893,'Cross Country Ultra Endurance 12/02/2020')"
-        link2 = mock.MagicMock()
-        link2.get.return_value = "loadInfoID(132894,'Road 12/03/2020')"
-        mock_soup.select.return_value = [link1, link2]
+        race_results = client.get_race_results('1337864')
         
-        # Mock _extract_load_info_id
-        mock_extract_load_info_id.side_effect = ['132893', '132894']
+        self.assertEqual([rider.name for rider in race_results.riders], ['John Doe', 'Jane Roe'])
+        self.assertIsNone(race_results.riders[1].team)
         
-        # Mock _extract_text
-        mock_extract_text.side_effect = ['Cross Country Ultra Endurance 12/02/2020', 'Road 12/03/2020']
+        # A malformed first row still falls back to validating each rider
+        mock_get_race_results.return_value['riders'] = [
+            {'place': '1'},
+            {'place': '2', 'name': 'Jane Roe'},
+        ]
+        race_results = client.get_race_results('1337864')
+        self.assertEqual([rider.name for rider in race_results.riders], ['Jane Roe'])
+        
+        # So does a later row that is not a dictionary at all
+        mock_get_race_results.return_value['riders'] = [
+            {'place': '1', 'name': 'John Doe'},
+            None,
+        ]
+        race_results = client.get_race_results('1337864')
+        self.assertEqual([rider.name for rider in race_results.riders], ['John Doe'])
+    
+    @mock.patch('pyusacycling.parser.EventDetailsParser.fetch_permit_page')
+    def test_get_disciplines_for_event(self, mock_fetch_permit_page):
+        """Test getting disciplines for an event."""
+        mock_fetch_permit_page.return_value = (
+            "<html><body>"
+            "<a href='#' onclick=\"loadInfoID(132893,'Cross Country Ultra Endurance 12/02/2020')\">"
+            "Cross Country Ultra Endurance 12/02/2020</a>"
+            "<a href='#' onclick=\"loadInfoID(132894,'Road 12/03/2020')\">Road 12/03/2020</a>"
+            "<a href='#' onclick=\"showResults()\">Not a discipline</a>"
+            "</body></html>"
+        )
         
         # Get disciplines
         disciplines = self.client.get_disciplines_for_event('2020-26')
         
         # Verify results
+        mock_fetch_permit_page.assert_called_once_with('2020-26')
         self.assertEqual(len(disciplines), 2)
         self.assertEqual(disciplines[0]['id'], '132893')
         self.assertEqual(disciplines[0]['name'], 'Cross Country Ultra Endurance')
@@ -200,6 +375,65 @@ class TestUSACyclingClient(unittest.TestCase):
         self.assertEqual(disciplines[1]['name'], 'Road')
         self.assertEqual(disciplines[1]['label'], 'Road 12/03/2020')
     
+    @mock.patch('pyusacycling.parser.EventDetailsParser.fetch_permit_page')
+    def test_get_disciplines_for_event_sample_page(self, mock_fetch_permit_page):
+        """Test extracting disciplines from a saved permit page."""
+        with open(self.samples_dir / "permit_pages" / "2020-26.html", encoding="utf-8") as f:
+            mock_fetch_permit_page.return_value = f.read()
+        
+        disciplines = self.client.get_disciplines_for_event('2020-26')
+        
+        self.assertEqual(len(disciplines), 5)
+        self.assertEqual(disciplines[0], {
+            'id': '132893',
+            'name': 'Cross Country Ultra Endurance',
+            'label': 'Cross Country Ultra Endurance 12/02/2020',
+        })
+        
+        # An empty page yields no disciplines rather than a parse failure
+        mock_fetch_permit_page.return_value = ""
+        self.assertEqual(self.client.get_disciplines_for_event('2020-26'), [])
+        
+        # So does a page with only a comment, which lxml considers empty
+        mock_fetch_permit_page.return_value = "<!-- no results -->"
+        self.assertEqual(self.client.get_disciplines_for_event('2020-26'), [])
+        
+        # A page declaring its encoding is parsed rather than rejected
+        mock_fetch_permit_page.return_value = (
+            '<?xml version="1.0" encoding="utf-8"?>'
+            "<html><body>"
+            "<a onclick=\"loadInfoID(132893,'Road 12/02/2020')\">Road 12/02/2020</a>"
+            "</body></html>"
+        )
+        self.assertEqual(self.client.get_disciplines_for_event('2020-26'), [
+            {'id': '132893', 'name': 'Road', 'label': 'Road 12/02/2020'},
+        ])
+    
+    @mock.patch('pyusacycling.parser.RaceResultsParser.fetch_load_info')
+    @mock.patch('pyusacycling.client.USACyclingClient.get_race_categories')
+    @mock.patch('pyusacycling.parser.EventDetailsParser.fetch_permit_page')
+    def test_get_races_for_permit_fetches_permit_once(self, mock_fetch_permit_page,
+                                                      mock_get_race_categories,
+                                                      mock_fetch_load_info):
+        """Test that the race link fallback reuses the already parsed permit page."""
+        mock_fetch_permit_page.return_value = (
+            "<html><body>"
+            "<a onclick=\"loadInfoID(132893,'Road 12/02/2020')\">Road 12/02/2020</a>"
+            "<a onclick=\"loadInfoID(132894,'Crit 12/03/2020')\">Crit 12/03/2020</a>"
+            "<a onclick=\"loadRace(132893, 'race_1337864')\">Men A</a>"
+            "</body></html>"
+        )
+        mock_get_race_categories.side_effect = ParseError("No categories")
+        mock_fetch_load_info.return_value = {"categories": []}
+        
+        races = self.client.get_races_for_permit('2020-26')
+        
+        self.assertEqual(mock_fetch_permit_page.call_count, 1)
+        self.assertEqual(len(races), 1)
+        self.assertEqual(races[0]['id'], '1337864')
+        self.assertEqual(races[0]['discipline_id'], '132893')
+        self.assertEqual(races[0]['name'], 'Men A')
+    
     @mock.patch('pyusacycling.client.USACyclingClient.get_event_details')
     @mock.patch('pyusacycling.client.USACyclingClient.get_disciplines_for_event')
     @mock.patch('pyusacycling.client.USACyclingClient.get_race_categories')
@@ -252,6 +486,72 @@ class TestUSACyclingClient(unittest.TestCase):
         self.assertEqual(len(event_data['results']), 1)
         self.assertEqual(event_data['results']['1337864'], race_result)
     
+    @mock.patch('pyusacycling.client.USACyclingClient.get_event_details')
+    @mock.patch('pyusacycling.client.USACyclingClient.get_disciplines_for_event')
+    @mock.patch('pyusacycling.client.USACyclingClient.get_race_categories')
+    @mock.patch('pyusacycling.client.USACyclingClient.get_race_results')
+    def test_aget_complete_event_data(self, mock_get_race_results, mock_get_race_categories,
+                                      mock_get_disciplines, mock_get_event_details):
+        """Test getting complete event data asynchronously."""
+        mock_get_event_details.return_value = mock.sentinel.details
+        mock_get_disciplines.return_value = [
+            {'id': '132893', 'name': 'Road', 'label': 'Road 12/02/2020'},
+            {'id': '132894', 'name': 'Crit', 'label': 'Crit 12/03/2020'},
+        ]
+        
+        category = mock.MagicMock(spec=RaceCategory)
+        category.id = '1337864'
+        mock_get_race_categories.side_effect = [[category], ParseError("No categories")]
+        mock_get_race_results.return_value = mock.sentinel.race_result
+        
+        event_data = asyncio.run(self.client.aget_complete_event_data('2020-26'))
+        
+        self.assertIs(event_data['details'], mock.sentinel.details)
+        self.assertEqual(event_data['categories'], [category])
+        self.assertEqual(event_data['results'], {'1337864': mock.sentinel.race_result})
+        mock_get_race_results.assert_called_once_with('1337864', category_info=category)
+    
+    @mock.patch('pyusacycling.client.USACyclingClient.get_race_categories')
+    @mock.patch('pyusacycling.parser.BaseParser._fetch_content')
+    def test_aget_complete_event_data_fetches_permit_once(self, mock_fetch_content,
+                                                          mock_get_race_categories):
+        """Test that details and disciplines share one permit page fetch on a cold cache."""
+        with open(self.samples_dir / "permit_pages" / "2020-26.html", encoding="utf-8") as f:
+            mock_fetch_content.return_value = f.read()
+        mock_get_race_categories.return_value = []
+        
+        with tempfile.TemporaryDirectory() as cache_dir:
+            client = USACyclingClient(cache_dir=cache_dir)
+            event_data = asyncio.run(
+                client.aget_complete_event_data('2020-26', include_results=False)
+            )
+        
+        self.assertEqual(event_data['details'].name, 'USA Cycling December VRL')
+        self.assertEqual(len(event_data['disciplines']), 5)
+        permit_fetches = [
+            call for call in mock_fetch_content.call_args_list
+            if 'permit=2020-26' in call.args[0]
+        ]
+        self.assertEqual(len(permit_fetches), 1)
+    
+    def test_max_workers_must_be_positive(self):
+        """Test that a client cannot be created without any workers."""
+        with self.assertRaises(ValidationError):
+            USACyclingClient(cache_enabled=False, max_workers=0)
+    
+    def test_rate_limit_budget_must_be_positive(self):
+        """Test that a client cannot be created with a rate limit that never admits a request."""
+        for kwargs in (
+            {'rate_limit_calls': 0},
+            {'rate_limit_calls': -1},
+            {'rate_limit_period': 0},
+            {'rate_limit_period': -1.0},
+        ):
+            with self.subTest(**kwargs):
+                with self.assertRaises(ValidationError) as ctx:
+                    USACyclingClient(cache_enabled=False, **kwargs)
+                self.assertEqual(ctx.exception.field, next(iter(kwargs)))
+    
     def test_parse_date(self):
         """Test parsing a date string."""
         # Test with various date formats
@@ -1,6 +1,7 @@
 """
 Tests for the rate limiting utilities.
 """
+import logging
 import unittest
 from datetime import datetime, timedelta
 from unittest import mock
@@ -107,6 +108,18 @@ class TestRateLimiting(unittest.TestCase):
         # Sleep should have been called
         self.assertTrue(self.mock_sleep.call_count >= 1)
     
+    def test_rate_limiter_log_level(self):
+        """Test that throttling messages are logged at the configured level."""
+        limiter = RateLimiter(name="quiet", max_calls=1, period=10, jitter=False,
+                              log_level=logging.DEBUG)
+        
+        with self.assertLogs('pyusacycling.rate_limiter.quiet', level='DEBUG') as logs:
+            limiter.acquire()
+            limiter.acquire()
+        
+        self.assertTrue(logs.records)
+        self.assertTrue(all(record.levelno == logging.DEBUG for record in logs.records))
+    
     def test_rate_limiter_context(self):
         """Test RateLimiter as a context manager."""
         # Create a rate limiter with no jitter for predictable testing